@@ -6,18 +6,22 @@ Workflow:
 2. Prompt the user for two actor names.
 3. Build an Actor graph from the movie dataset.
 4. Compute the shortest path (Bacon number) between the two actors using
-   ActorQuery's BFS traversal.
+   ActorQuery's BFS traversal, reusing a cached result from an earlier run
+   on the same dataset when available.
 5. Print the Bacon number and detailed path with shared films.
 
 Modules:
 - utils.loader: Handles CSV loading and Actor object construction.
 - processor.actorQuery: Handles pathfinding and Bacon number computation.
+- processor.queryCache: Persists query results across runs.
 """
 
 from utils.loader import Loader
 from processor.actorQuery import ActorQuery
+from processor.queryCache import QueryCache
 
 FILEPATH = "data/actorfilms.csv"
+CACHE_PATH = "data/query_cache.sqlite3"
 
 # Load dataset and prompt user for actors
 loader = Loader(FILEPATH)
@@ -25,8 +29,9 @@ loader = Loader(FILEPATH)
 # Initialize ActorQuery with user-provided actors
 query = ActorQuery(loader.actor_1, loader.actor_2)
 
-# Compute the Bacon number path
-query.run_bfs(loader.actor_dict)
+# Compute the Bacon number path, consulting the on-disk cache first
+with QueryCache(CACHE_PATH, loader.graph_version) as cache:
+    query.run_cached(loader.actor_dict, cache, loader.film_catalog)
 
 # Print the path and the Bacon number
 query.print_string()
\ No newline at end of file
@@ -1,2 +1,3 @@
 from .actor import Actor
-from .film import Film
\ No newline at end of file
+from .film import Film
+from .filmCatalog import FilmCatalog
\ No newline at end of file
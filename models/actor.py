@@ -13,7 +13,8 @@ class Actor:
     Attributes:
         name (str): Actor's full name.
         id (str): Unique identifier for the actor.
-        films (List[str]): List of films the actor has appeared in.
+        films (List[int]): Films the actor has appeared in, as indices
+            into the loader's FilmCatalog.
         costars (Set[str]): Set of actor names who have co-starred with this actor.
         explored (bool): Whether the actor has been visited in a graph search.
         bacon_number (int): Distance from a starting actor in a graph traversal
@@ -21,7 +22,7 @@ class Actor:
     """
     name: str
     id: str
-    films: list[str]
+    films: list[int]
     costars: set[str] = field(default_factory=set)
     explored: bool = field(default=False)
     bacon_number: int = field(default=inf)
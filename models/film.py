@@ -10,10 +10,12 @@ class Film:
         rating (float): IMDb rating of the film.
         film_id (str): Unique identifier for the film.
         cast (List[str]): List of actors in the film.
+        votes (int): Number of IMDb votes behind the rating.
     """
     name: str
     year: int
     rating: float
     id: str
     cast: list[str] = field(default_factory=list)
+    votes: int = field(default=0)
 
@@ -0,0 +1,88 @@
+# == Standard Library imports ==
+from dataclasses import dataclass, field
+# == Third party import
+import numpy as np
+# == Local import
+from .film import Film
+
+@dataclass
+class FilmCatalog:
+    """
+    Columnar catalog of every film in the dataset, keyed by FilmID.
+
+    Films are addressed by a dense integer index (0..n-1) assigned in order
+    of first appearance; Actor.films stores these indices. Per-film fields
+    are held in parallel arrays, titles are interned once in a lookup table,
+    and casts are stored CSR-style: the cast of film i is
+    cast_members[cast_offsets[i]:cast_offsets[i + 1]], as actor indices into
+    actor_names.
+
+    Attributes:
+        film_ids (List[str]): External FilmID for each film index.
+        title_codes (np.ndarray): Index into titles for each film.
+        titles (List[str]): Unique, interned film titles.
+        years (np.ndarray): Year of release per film, 0 if unknown.
+        ratings (np.ndarray): IMDb rating per film, NaN if unknown.
+        votes (np.ndarray): IMDb vote count per film, 0 if unknown.
+        cast_offsets (np.ndarray): Start of each film's cast in
+            cast_members, with a final end sentinel (length n + 1).
+        cast_members (np.ndarray): Actor indices of every film's cast.
+        actor_names (List[str]): Actor name for each actor index.
+    """
+    film_ids: list[str]
+    title_codes: np.ndarray
+    titles: list[str]
+    years: np.ndarray
+    ratings: np.ndarray
+    votes: np.ndarray
+    cast_offsets: np.ndarray
+    cast_members: np.ndarray
+    actor_names: list[str]
+    _index: dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """
+        Build the FilmID to film index lookup.
+        """
+        self._index = {film_id: i for i, film_id in enumerate(self.film_ids)}
+
+    def __len__(self) -> int:
+        return len(self.film_ids)
+
+    def index_of(self, film_id: str) -> int:
+        """
+        :param film_id: External FilmID.
+        :return: Dense film index for the FilmID.
+        """
+        return self._index[film_id]
+
+    def title(self, film: int) -> str:
+        """
+        :param film: Dense film index.
+        :return: Title of the film.
+        """
+        return self.titles[self.title_codes[film]]
+
+    def cast(self, film: int) -> np.ndarray:
+        """
+        :param film: Dense film index.
+        :return: Actor indices of the film's cast (a view, not a copy).
+        """
+        return self.cast_members[self.cast_offsets[film]:
+                                 self.cast_offsets[film + 1]]
+
+    def get_film(self, film: int) -> Film:
+        """
+        Materialize a Film object for a single catalog entry.
+
+        :param film: Dense film index.
+        :return: Film populated from the catalog columns.
+        """
+        return Film(
+            name=self.title(film),
+            year=int(self.years[film]),
+            rating=float(self.ratings[film]),
+            id=self.film_ids[film],
+            cast=[self.actor_names[a] for a in self.cast(film)],
+            votes=int(self.votes[film]),
+        )
@@ -1 +1,2 @@
-from .actorQuery import ActorQuery
\ No newline at end of file
+from .actorQuery import ActorQuery
+from .queryCache import QueryCache
\ No newline at end of file
@@ -2,10 +2,13 @@
 from collections import deque
 from dataclasses import dataclass
 from math import inf
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List
 
 # == Local import
-from models import Actor
+from models import Actor, FilmCatalog
+
+if TYPE_CHECKING:
+    from .queryCache import QueryCache
 
 @dataclass
 class PathSegment:
@@ -39,23 +42,47 @@ def generate_actors_path(start: str, end: str, prev: Dict[str, str]) \
     path.reverse()
     return path
 
-def generate_complete_path(actors_dict: Dict[str, Actor], path: List[str]) \
+def _shared_film_labels(film_catalog: FilmCatalog, films: set[int]) \
+        -> List[str]:
+    """
+    Resolve shared film ids to sorted display labels. Titles shared by more
+    than one of the films (e.g. remakes) are suffixed with the release
+    year, or the FilmID if the year is unknown, to keep them apart.
+
+    :param film_catalog: Catalog used to resolve film ids.
+    :param films: Set of film ids shared by two actors.
+    :return: Sorted list of film labels.
+    """
+    shared = [film_catalog.get_film(film) for film in films]
+    titles = [film.name for film in shared]
+    return sorted(
+        f"{film.name} ({film.year or film.id})"
+        if titles.count(film.name) > 1 else film.name
+        for film in shared
+    )
+
+def generate_complete_path(actors_dict: Dict[str, Actor], path: List[str],
+                           film_catalog: FilmCatalog) \
         -> dict[int, PathSegment]:
     """
     Given a list of actors, build a mapping of actor pairs to their shared
-    films.
+    films. Shared films are found by intersecting film ids, which are then
+    resolved to titles through the catalog.
 
     :param actors_dict: Dictionary mapping actor name to Actor object.
     :param path: List of actor names representing the path from origin to
     destination.
+    :param film_catalog: Catalog used to resolve film ids to titles.
     :return: Dictionary mapping pair index to PathSegment objects.
     """
     return {
         i: PathSegment(
             actor1=curr_actor,
             actor2=next_actor,
-            shared_films=sorted(
-                set(actors_dict[curr_actor].films) & set(actors_dict[next_actor].films)
+            shared_films=_shared_film_labels(
+                film_catalog,
+                set(actors_dict[curr_actor].films)
+                & set(actors_dict[next_actor].films)
             )
         )
         for i, (curr_actor, next_actor) in enumerate(zip(path, path[1:]))
@@ -109,13 +136,15 @@ class ActorQuery:
         return self.valid_origin and self.valid_destination, messages
 
     # assume dictionary containing k: actor name, v: actor objects
-    def run_bfs(self, actors_dict: dict) -> None:
+    def run_bfs(self, actors_dict: dict, film_catalog: FilmCatalog) -> None:
         """
         Compute the shortest path (Bacon number) from origin to destination
         using breadth-first search (BFS). Updates self.bacon_number and
         self.complete_path.
 
         :param actors_dict: Dictionary mapping actor names to Actor objects.
+        :param film_catalog: Catalog used to resolve shared film ids to
+        titles.
         """
         # check is valid (both actors present)
         is_valid, messages = self._check_valid(actors_dict)
@@ -164,7 +193,38 @@ class ActorQuery:
         self.bacon_number = actors_dict[self.act_destination].bacon_number
         # generate simple actors path and use it to build a complete path
         path = generate_actors_path(self.act_origin, self.act_destination, prev)
-        self.complete_path = generate_complete_path(actors_dict, path)
+        self.complete_path = generate_complete_path(actors_dict, path,
+                                                    film_catalog)
+
+    def run_cached(self, actors_dict: dict, cache: "QueryCache",
+                   film_catalog: FilmCatalog) -> None:
+        """
+        Compute the Bacon number and path, consulting a QueryCache first.
+        On a miss, falls back to run_bfs and stores the result for later
+        runs. Queries with unknown actors are never cached.
+
+        :param actors_dict: Dictionary mapping actor names to Actor objects.
+        :param cache: QueryCache opened for the same graph version as
+        actors_dict.
+        :param film_catalog: Catalog used to resolve shared film ids to
+        titles.
+        """
+        # same-actor queries are trivial, no need to touch the cache
+        if self.act_origin == self.act_destination:
+            self.run_bfs(actors_dict, film_catalog)
+            return
+
+        cached = cache.get(self.act_origin, self.act_destination)
+        if cached is not None:
+            # only valid queries are cached, so both actors must exist
+            self.valid_origin = self.valid_destination = True
+            self.bacon_number, self.complete_path = cached
+            return
+
+        self.run_bfs(actors_dict, film_catalog)
+        if self.valid_origin and self.valid_destination:
+            cache.put(self.act_origin, self.act_destination,
+                      self.bacon_number, self.complete_path)
 
     def _get_path_strings(self) -> List[str]:
         """
@@ -0,0 +1,182 @@
+# == Standard Library imports ==
+import json
+import sqlite3
+import time
+from math import inf
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+# == Local import
+from .actorQuery import PathSegment
+
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_TIMEOUT = 5.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS query_cache (
+    origin TEXT NOT NULL,
+    destination TEXT NOT NULL,
+    graph_version TEXT NOT NULL,
+    bacon_number INTEGER,
+    path TEXT NOT NULL,
+    last_access REAL NOT NULL,
+    PRIMARY KEY (origin, destination, graph_version)
+)
+"""
+_INDEX = ("CREATE INDEX IF NOT EXISTS idx_query_cache_last_access "
+          "ON query_cache (last_access)")
+
+
+def _encode_path(complete_path: Dict[int, PathSegment]) -> str:
+    """
+    Serialize a complete path to a JSON string, ordered by segment index.
+
+    :param complete_path: Mapping of pair index to PathSegment objects.
+    :return: JSON list of [actor1, actor2, shared_films] entries.
+    """
+    return json.dumps([
+        [segment.actor1, segment.actor2, segment.shared_films]
+        for _, segment in sorted(complete_path.items())
+    ])
+
+
+def _decode_path(raw: str) -> Dict[int, PathSegment]:
+    """
+    Rebuild a complete path from its JSON representation.
+
+    :param raw: JSON string produced by _encode_path.
+    :return: Mapping of pair index to PathSegment objects.
+    """
+    return {
+        i: PathSegment(actor1=actor1, actor2=actor2, shared_films=films)
+        for i, (actor1, actor2, films) in enumerate(json.loads(raw))
+    }
+
+
+class QueryCache:
+    """
+    Persistent on-disk cache of query results, backed by SQLite.
+
+    Results are keyed by (origin, destination, graph_version), so a cache
+    built from one snapshot of the dataset is never served for another;
+    entries from other snapshots are dropped when the cache is opened. The
+    database runs in WAL mode so several processes can read and write the
+    same file concurrently. Once more than max_entries results are stored,
+    the least recently used ones are evicted.
+
+    Attributes:
+        filepath (Path): Path to the SQLite database file.
+        graph_version (str): Version of the actor graph results belong to.
+        max_entries (int): Maximum number of results kept on disk.
+    """
+    def __init__(self, fpath: str, graph_version: str,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 timeout: float = DEFAULT_TIMEOUT):
+        """
+        Open (creating if needed) the cache database.
+
+        :param fpath: Path to the SQLite database file.
+        :param graph_version: Version of the currently loaded actor graph.
+        :param max_entries: Maximum number of results kept on disk.
+        :param timeout: Seconds to wait for another process's lock.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.filepath: Path = Path(fpath)
+        self.graph_version: str = graph_version
+        self.max_entries: int = max_entries
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        # autocommit mode; write transactions are opened explicitly
+        self._conn = sqlite3.connect(self.filepath, timeout=timeout,
+                                     isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.execute(_INDEX)
+        self._write(("DELETE FROM query_cache WHERE graph_version != ?",
+                     (self.graph_version,)))
+
+    def _write(self, *statements: Tuple[str, tuple]) -> None:
+        """
+        Run statements in a single write transaction. The write lock is
+        taken up front (BEGIN IMMEDIATE) so concurrent writers queue on the
+        busy timeout instead of failing mid-transaction.
+
+        :param statements: Pairs of (sql, parameters) to execute in order.
+        """
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            for sql, params in statements:
+                self._conn.execute(sql, params)
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def get(self, origin: str, destination: str) \
+            -> Optional[Tuple[float, Dict[int, PathSegment]]]:
+        """
+        Look up a cached result and mark it as recently used.
+
+        :param origin: Name of the origin actor.
+        :param destination: Name of the destination actor.
+        :return: Tuple of (bacon_number, complete_path), or None on a miss.
+        """
+        row = self._conn.execute(
+            "SELECT bacon_number, path FROM query_cache "
+            "WHERE origin = ? AND destination = ? AND graph_version = ?",
+            (origin, destination, self.graph_version)
+        ).fetchone()
+        if row is None:
+            return None
+        self._write((
+            "UPDATE query_cache SET last_access = ? "
+            "WHERE origin = ? AND destination = ? AND graph_version = ?",
+            (time.time(), origin, destination, self.graph_version)
+        ))
+        bacon_number, raw_path = row
+        # no path is stored as NULL, since SQLite has no infinity literal
+        return (inf if bacon_number is None else bacon_number,
+                _decode_path(raw_path))
+
+    def put(self, origin: str, destination: str, bacon_number: float,
+            complete_path: Dict[int, PathSegment]) -> None:
+        """
+        Store a result, evicting the least recently used entries if the
+        cache grows beyond max_entries.
+
+        :param origin: Name of the origin actor.
+        :param destination: Name of the destination actor.
+        :param bacon_number: Computed Bacon number, inf if no path exists.
+        :param complete_path: Mapping of pair index to PathSegment objects.
+        """
+        self._write(
+            ("INSERT OR REPLACE INTO query_cache (origin, destination, "
+             "graph_version, bacon_number, path, last_access) "
+             "VALUES (?, ?, ?, ?, ?, ?)",
+             (origin, destination, self.graph_version,
+              None if bacon_number == inf else int(bacon_number),
+              _encode_path(complete_path), time.time())),
+            ("DELETE FROM query_cache WHERE rowid IN ("
+             "SELECT rowid FROM query_cache ORDER BY last_access DESC "
+             "LIMIT -1 OFFSET ?)",
+             (self.max_entries,)),
+        )
+
+    def __len__(self) -> int:
+        """
+        :return: Number of results currently stored.
+        """
+        return self._conn.execute(
+            "SELECT COUNT(*) FROM query_cache").fetchone()[0]
+
+    def close(self) -> None:
+        """
+        Close the underlying database connection.
+        """
+        self._conn.close()
+
+    def __enter__(self) -> "QueryCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
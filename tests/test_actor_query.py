@@ -1,11 +1,34 @@
 # == Third party import
+import numpy as np
 import pytest
 # == Local import
 from models.actor import Actor
+from models.filmCatalog import FilmCatalog
 from processor.actorQuery import ActorQuery, PathSegment, generate_actors_path, \
     generate_complete_path
 
 
+@pytest.fixture
+def sample_catalog():
+    """
+    Create a small film catalog for testing:
+    - Apollo 13 (film 0) with Tom Hanks, Kevin Bacon, Bill Paxton
+    - Guardians (film 1) with Bill Paxton, Chris Pratt
+    """
+    return FilmCatalog(
+        film_ids=["F1", "F2"],
+        title_codes=np.array([0, 1], dtype=np.int32),
+        titles=["Apollo 13", "Guardians"],
+        years=np.array([1995, 2014], dtype=np.int32),
+        ratings=np.array([7.6, 8.0], dtype=np.float32),
+        votes=np.array([300000, 1200000], dtype=np.int64),
+        cast_offsets=np.array([0, 3, 5], dtype=np.int64),
+        cast_members=np.array([0, 1, 2, 2, 3], dtype=np.int32),
+        actor_names=["Tom Hanks", "Kevin Bacon", "Bill Paxton",
+                     "Chris Pratt"],
+    )
+
+
 @pytest.fixture
 def sample_actor_dict():
     """
@@ -14,9 +37,9 @@ def sample_actor_dict():
     - Kevin Bacon acted with Bill Paxton in Apollo 13
     - Tom Hanks acted with Bill Paxton in Apollo 13
     """
-    tom = Actor(name="Tom Hanks", id="A1", films=["Apollo 13"])
-    kevin = Actor(name="Kevin Bacon", id="A2", films=["Apollo 13"])
-    bill = Actor(name="Bill Paxton", id="A3", films=["Apollo 13"])
+    tom = Actor(name="Tom Hanks", id="A1", films=[0])
+    kevin = Actor(name="Kevin Bacon", id="A2", films=[0])
+    bill = Actor(name="Bill Paxton", id="A3", films=[0])
 
     # Populate costars
     tom.costars.update(["Kevin Bacon", "Bill Paxton"])
@@ -30,10 +53,10 @@ def sample_actor_dict():
     }
 
 
-def test_run_bfs_shortest_path(sample_actor_dict):
+def test_run_bfs_shortest_path(sample_actor_dict, sample_catalog):
     """Test BFS finds the shortest path and correct Bacon number."""
     query = ActorQuery("Tom Hanks", "Bill Paxton")
-    query.run_bfs(sample_actor_dict)
+    query.run_bfs(sample_actor_dict, sample_catalog)
 
     # Bacon number should be 1 since they are direct co-stars
     assert query.bacon_number == 1
@@ -47,16 +70,17 @@ def test_run_bfs_shortest_path(sample_actor_dict):
     assert segment.shared_films == ["Apollo 13"]
 
 
-def test_run_bfs_multiple_hops(sample_actor_dict):
+def test_run_bfs_multiple_hops(sample_actor_dict, sample_catalog):
     """Test BFS finds shortest path when multiple hops exist."""
     # Add an extra actor to force multi-hop
-    chris = Actor(name="Chris Pratt", id="A4", films=["Guardians"])
+    chris = Actor(name="Chris Pratt", id="A4", films=[1])
     chris.costars.update(["Bill Paxton"])
     sample_actor_dict["Bill Paxton"].costars.add("Chris Pratt")
+    sample_actor_dict["Bill Paxton"].films.append(1)
     sample_actor_dict["Chris Pratt"] = chris
 
     query = ActorQuery("Tom Hanks", "Chris Pratt")
-    query.run_bfs(sample_actor_dict)
+    query.run_bfs(sample_actor_dict, sample_catalog)
 
     # Should find path via Bill Paxton
     assert query.bacon_number == 2
@@ -64,21 +88,22 @@ def test_run_bfs_multiple_hops(sample_actor_dict):
         query.complete_path[max(query.complete_path.keys())].actor2]
     assert path_actors[0] == "Tom Hanks"
     assert path_actors[-1] == "Chris Pratt"
+    assert query.complete_path[1].shared_films == ["Guardians"]
 
 
-def test_run_bfs_same_actor(sample_actor_dict):
+def test_run_bfs_same_actor(sample_actor_dict, sample_catalog):
     """Test BFS when origin and destination are the same."""
     query = ActorQuery("Tom Hanks", "Tom Hanks")
-    query.run_bfs(sample_actor_dict)
+    query.run_bfs(sample_actor_dict, sample_catalog)
 
     assert query.bacon_number == 0
     assert query.complete_path == {}
 
 
-def test_run_bfs_missing_actor(sample_actor_dict, capsys):
+def test_run_bfs_missing_actor(sample_actor_dict, sample_catalog, capsys):
     """Test BFS when one actor is missing."""
     query = ActorQuery("Tom Hanks", "Unknown Actor")
-    query.run_bfs(sample_actor_dict)
+    query.run_bfs(sample_actor_dict, sample_catalog)
 
     captured = capsys.readouterr()
     assert "Second actor Unknown Actor not found." in captured.out
@@ -86,10 +111,10 @@ def test_run_bfs_missing_actor(sample_actor_dict, capsys):
     assert query.complete_path == {}
 
 
-def test_get_path_strings_returns_correct_format(sample_actor_dict):
+def test_get_path_strings_returns_correct_format(sample_actor_dict, sample_catalog):
     """Test _get_path_strings returns formatted output."""
     query = ActorQuery("Tom Hanks", "Kevin Bacon")
-    query.run_bfs(sample_actor_dict)
+    query.run_bfs(sample_actor_dict, sample_catalog)
 
     strings = query._get_path_strings()
     assert isinstance(strings, list)
@@ -99,13 +124,15 @@ def test_get_path_strings_returns_correct_format(sample_actor_dict):
         strings)
 
 
-def test_generate_actors_path_and_complete_path(sample_actor_dict):
+def test_generate_actors_path_and_complete_path(sample_actor_dict,
+                                                sample_catalog):
     """Test the helper functions directly."""
     prev = {"Kevin Bacon": "Tom Hanks", "Bill Paxton": "Kevin Bacon"}
     path = generate_actors_path("Tom Hanks", "Bill Paxton", prev)
     assert path == ["Tom Hanks", "Kevin Bacon", "Bill Paxton"]
 
-    complete_path = generate_complete_path(sample_actor_dict, path)
+    complete_path = generate_complete_path(sample_actor_dict, path,
+                                           sample_catalog)
     assert len(complete_path) == 2
     segment0 = complete_path[0]
     assert segment0.actor1 == "Tom Hanks"
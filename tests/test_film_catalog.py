@@ -0,0 +1,93 @@
+# == Third party import
+import numpy as np
+import pytest
+# == Local import
+from models.actor import Actor
+from models.film import Film
+from models.filmCatalog import FilmCatalog
+from processor.actorQuery import ActorQuery, generate_complete_path
+
+
+@pytest.fixture
+def sample_catalog():
+    """
+    Create a small catalog for testing:
+    - Apollo 13 (F1) with Tom Hanks, Kevin Bacon, Bill Paxton
+    - Forrest Gump (F2) with Tom Hanks
+    """
+    return FilmCatalog(
+        film_ids=["F1", "F2"],
+        title_codes=np.array([0, 1], dtype=np.int32),
+        titles=["Apollo 13", "Forrest Gump"],
+        years=np.array([1995, 1994], dtype=np.int32),
+        ratings=np.array([7.6, 8.8], dtype=np.float32),
+        votes=np.array([300000, 2000000], dtype=np.int64),
+        cast_offsets=np.array([0, 3, 4], dtype=np.int64),
+        cast_members=np.array([0, 1, 2, 0], dtype=np.int32),
+        actor_names=["Tom Hanks", "Kevin Bacon", "Bill Paxton"],
+    )
+
+
+def test_catalog_lookups(sample_catalog):
+    """Test FilmID lookup, titles and cast slices."""
+    assert len(sample_catalog) == 2
+    assert sample_catalog.index_of("F2") == 1
+    assert sample_catalog.title(1) == "Forrest Gump"
+    assert sample_catalog.cast(0).tolist() == [0, 1, 2]
+    assert sample_catalog.cast(1).tolist() == [0]
+
+
+def test_catalog_unknown_film_id(sample_catalog):
+    """Test that an unknown FilmID raises KeyError."""
+    with pytest.raises(KeyError):
+        sample_catalog.index_of("F3")
+
+
+def test_get_film_materializes_film(sample_catalog):
+    """Test that get_film builds a Film from the catalog columns."""
+    film = sample_catalog.get_film(1)
+
+    assert isinstance(film, Film)
+    assert film.name == "Forrest Gump"
+    assert film.year == 1994
+    assert film.rating == pytest.approx(8.8)
+    assert film.id == "F2"
+    assert film.cast == ["Tom Hanks"]
+    assert film.votes == 2000000
+
+
+def test_run_bfs_resolves_film_titles(sample_catalog):
+    """Test that shared film ids are reported as titles on the path."""
+    tom = Actor(name="Tom Hanks", id="A1", films=[0, 1])
+    kevin = Actor(name="Kevin Bacon", id="A2", films=[0])
+    tom.costars.add("Kevin Bacon")
+    kevin.costars.add("Tom Hanks")
+
+    query = ActorQuery("Tom Hanks", "Kevin Bacon")
+    query.run_bfs({"Tom Hanks": tom, "Kevin Bacon": kevin}, sample_catalog)
+
+    assert query.bacon_number == 1
+    assert query.complete_path[0].shared_films == ["Apollo 13"]
+
+
+def test_duplicate_shared_titles_are_disambiguated():
+    """Test that shared remakes with the same title are labelled by year."""
+    catalog = FilmCatalog(
+        film_ids=["F1", "F2"],
+        title_codes=np.array([0, 0], dtype=np.int32),
+        titles=["Hamlet"],
+        years=np.array([1990, 1996], dtype=np.int32),
+        ratings=np.array([6.8, 7.7], dtype=np.float32),
+        votes=np.array([100, 200], dtype=np.int64),
+        cast_offsets=np.array([0, 2, 4], dtype=np.int64),
+        cast_members=np.array([0, 1, 0, 1], dtype=np.int32),
+        actor_names=["Tom Hanks", "Kevin Bacon"],
+    )
+    actors_dict = {
+        "Tom Hanks": Actor(name="Tom Hanks", id="A1", films=[0, 1]),
+        "Kevin Bacon": Actor(name="Kevin Bacon", id="A2", films=[0, 1]),
+    }
+
+    complete_path = generate_complete_path(
+        actors_dict, ["Tom Hanks", "Kevin Bacon"], catalog)
+    assert complete_path[0].shared_films == ["Hamlet (1990)", "Hamlet (1996)"]
@@ -9,7 +9,11 @@ from utils.loader import Loader
 sample_data = pd.DataFrame({
     "Actor": ["Tom Hanks", "Kevin Bacon", "Bill Paxton", "Tom Hanks"],
     "ActorID": ["A1", "A2", "A3", "A1"],
-    "Film": ["Apollo 13", "Apollo 13", "Apollo 13", "Forrest Gump"]
+    "Film": ["Apollo 13", "Apollo 13", "Apollo 13", "Forrest Gump"],
+    "Year": ["1995", "1995", "1995", "1994"],
+    "Votes": ["300000", "300000", "300000", "2000000"],
+    "Rating": ["7.6", "7.6", "7.6", "8.8"],
+    "FilmID": ["F1", "F1", "F1", "F2"]
 })
 
 @pytest.fixture
@@ -40,10 +44,13 @@ def test_actor_graph_population(loader_instance):
     tom_hanks = actor_dict["Tom Hanks"]
     kevin_bacon = actor_dict["Kevin Bacon"]
 
+    catalog = loader_instance.film_catalog
+
     # Tom Hanks films
-    assert set(tom_hanks.films) == {"Apollo 13", "Forrest Gump"}
+    assert {catalog.title(f) for f in tom_hanks.films} == {"Apollo 13",
+                                                          "Forrest Gump"}
     # Kevin Bacon films
-    assert kevin_bacon.films == ["Apollo 13"]
+    assert [catalog.title(f) for f in kevin_bacon.films] == ["Apollo 13"]
     # Costars
     assert "Kevin Bacon" in tom_hanks.costars
     assert "Tom Hanks" in kevin_bacon.costars
@@ -55,7 +62,8 @@ def test_load_dataframe_method(monkeypatch, mock_inputs):
     loader = Loader("dummy_path.csv")
     df = loader._load_dataframe()
     assert isinstance(df, pd.DataFrame)
-    assert list(df.columns) == ["Actor", "ActorID", "Film"]
+    assert list(df.columns) == ["Actor", "ActorID", "Film", "Year", "Votes",
+                                "Rating", "FilmID"]
 
 def test_load_data_method(monkeypatch, mock_inputs):
     """Test _load_data returns a dictionary of Actor objects."""
@@ -66,4 +74,70 @@ def test_load_data_method(monkeypatch, mock_inputs):
     for actor in actor_dict.values():
         assert isinstance(actor, Actor)
         assert isinstance(actor.films, list)
+        assert all(isinstance(film, int) for film in actor.films)
         assert isinstance(actor.costars, set)
+
+def test_graph_version_tracks_data(monkeypatch, mock_inputs):
+    """Test that graph_version is stable for the same data and changes
+    when the data changes."""
+    monkeypatch.setattr("pandas.read_csv", lambda filepath, dtype: sample_data)
+    version = Loader("dummy_path.csv").graph_version
+    assert version == Loader("dummy_path.csv").graph_version
+
+    changed = sample_data.copy()
+    changed.loc[3, "Film"] = "Cast Away"
+    monkeypatch.setattr("pandas.read_csv", lambda filepath, dtype: changed)
+    assert Loader("dummy_path.csv").graph_version != version
+
+def test_film_catalog_population(loader_instance):
+    """Test that the film catalog is keyed by FilmID with per-film fields."""
+    catalog = loader_instance.film_catalog
+    assert len(catalog) == 2
+
+    apollo = catalog.get_film(catalog.index_of("F1"))
+    assert apollo.name == "Apollo 13"
+    assert apollo.year == 1995
+    assert apollo.rating == pytest.approx(7.6)
+    assert apollo.votes == 300000
+    assert set(apollo.cast) == {"Tom Hanks", "Kevin Bacon", "Bill Paxton"}
+
+def test_remakes_keep_separate_casts(monkeypatch, mock_inputs):
+    """Test that films sharing a title but not a FilmID are not merged."""
+    remakes = pd.DataFrame({
+        "Actor": ["Tom Hanks", "Kevin Bacon", "Bill Paxton"],
+        "ActorID": ["A1", "A2", "A3"],
+        "Film": ["Hamlet", "Hamlet", "Hamlet"],
+        "Year": ["1990", "1990", "1996"],
+        "Votes": ["100", "100", "200"],
+        "Rating": ["6.8", "6.8", "7.7"],
+        "FilmID": ["F1", "F1", "F2"]
+    })
+    monkeypatch.setattr("pandas.read_csv", lambda filepath, dtype: remakes)
+    loader = Loader("dummy_path.csv")
+    actor_dict = loader.actor_dict
+
+    assert actor_dict["Tom Hanks"].costars == {"Kevin Bacon"}
+    assert actor_dict["Bill Paxton"].costars == set()
+    # the shared title string is interned once
+    catalog = loader.film_catalog
+    assert len(catalog.titles) == 1
+    assert catalog.title(0) is catalog.title(1)
+
+def test_rows_without_title_are_dropped(monkeypatch, mock_inputs):
+    """Test that a film with no title does not borrow another film's."""
+    untitled = pd.DataFrame({
+        "Actor": ["Tom Hanks", "Kevin Bacon", "Bill Paxton"],
+        "ActorID": ["A1", "A2", "A3"],
+        "Film": ["T1", None, "T2"],
+        "Year": ["1990", "1991", "1992"],
+        "Votes": ["100", "100", "100"],
+        "Rating": ["7.0", "7.0", "7.0"],
+        "FilmID": ["F1", "F2", "F3"]
+    })
+    monkeypatch.setattr("pandas.read_csv", lambda filepath, dtype: untitled)
+    loader = Loader("dummy_path.csv")
+    catalog = loader.film_catalog
+
+    assert catalog.film_ids == ["F1", "F3"]
+    assert [catalog.title(f) for f in range(len(catalog))] == ["T1", "T2"]
+    assert "Kevin Bacon" not in loader.actor_dict
@@ -0,0 +1,135 @@
+# == Standard Library import
+from math import inf
+# == Third party import
+import numpy as np
+import pytest
+# == Local import
+from models.actor import Actor
+from models.filmCatalog import FilmCatalog
+from processor.actorQuery import ActorQuery, PathSegment
+from processor.queryCache import QueryCache
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    """Path to a fresh cache database inside the test's temp directory."""
+    return tmp_path / "query_cache.sqlite3"
+
+
+@pytest.fixture
+def sample_catalog():
+    """A one-film catalog: Apollo 13 with Tom Hanks and Kevin Bacon."""
+    return FilmCatalog(
+        film_ids=["F1"],
+        title_codes=np.array([0], dtype=np.int32),
+        titles=["Apollo 13"],
+        years=np.array([1995], dtype=np.int32),
+        ratings=np.array([7.6], dtype=np.float32),
+        votes=np.array([300000], dtype=np.int64),
+        cast_offsets=np.array([0, 2], dtype=np.int64),
+        cast_members=np.array([0, 1], dtype=np.int32),
+        actor_names=["Tom Hanks", "Kevin Bacon"],
+    )
+
+
+@pytest.fixture
+def sample_path():
+    """A two-hop path from Tom Hanks to Chris Pratt."""
+    return {
+        0: PathSegment("Tom Hanks", "Bill Paxton", ["Apollo 13"]),
+        1: PathSegment("Bill Paxton", "Chris Pratt", ["Guardians"]),
+    }
+
+
+def test_put_and_get_round_trip(cache_path, sample_path):
+    """Test that a stored result is returned unchanged."""
+    with QueryCache(cache_path, "v1") as cache:
+        assert cache.get("Tom Hanks", "Chris Pratt") is None
+        cache.put("Tom Hanks", "Chris Pratt", 2, sample_path)
+        bacon_number, complete_path = cache.get("Tom Hanks", "Chris Pratt")
+
+    assert bacon_number == 2
+    assert complete_path == sample_path
+
+
+def test_no_path_result_is_cached(cache_path):
+    """Test that an infinite Bacon number survives the round trip."""
+    with QueryCache(cache_path, "v1") as cache:
+        cache.put("Tom Hanks", "Nobody", inf, {})
+        assert cache.get("Tom Hanks", "Nobody") == (inf, {})
+
+
+def test_results_persist_across_instances(cache_path, sample_path):
+    """Test that a second cache on the same file sees earlier results."""
+    with QueryCache(cache_path, "v1") as writer:
+        writer.put("Tom Hanks", "Chris Pratt", 2, sample_path)
+    with QueryCache(cache_path, "v1") as reader:
+        assert reader.get("Tom Hanks", "Chris Pratt") == (2, sample_path)
+
+
+def test_graph_version_change_invalidates(cache_path, sample_path):
+    """Test that results from another graph version are not served."""
+    with QueryCache(cache_path, "v1") as cache:
+        cache.put("Tom Hanks", "Chris Pratt", 2, sample_path)
+    with QueryCache(cache_path, "v2") as cache:
+        assert cache.get("Tom Hanks", "Chris Pratt") is None
+        assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted(cache_path, monkeypatch):
+    """Test that the cache stays within max_entries, evicting LRU first."""
+    clock = iter(range(100))
+    monkeypatch.setattr("processor.queryCache.time.time",
+                        lambda: next(clock))
+    with QueryCache(cache_path, "v1", max_entries=2) as cache:
+        cache.put("A", "B", 1, {})
+        cache.put("A", "C", 1, {})
+        # touch A -> B so that A -> C becomes least recently used
+        cache.get("A", "B")
+        cache.put("A", "D", 1, {})
+
+        assert len(cache) == 2
+        assert cache.get("A", "B") is not None
+        assert cache.get("A", "C") is None
+        assert cache.get("A", "D") is not None
+
+
+def test_invalid_max_entries(cache_path):
+    """Test that a non-positive size bound is rejected."""
+    with pytest.raises(ValueError):
+        QueryCache(cache_path, "v1", max_entries=0)
+
+
+def test_run_cached_skips_bfs_on_hit(cache_path, sample_catalog, monkeypatch):
+    """Test that ActorQuery.run_cached stores results and reuses them."""
+    tom = Actor(name="Tom Hanks", id="A1", films=[0])
+    kevin = Actor(name="Kevin Bacon", id="A2", films=[0])
+    tom.costars.add("Kevin Bacon")
+    kevin.costars.add("Tom Hanks")
+    actors_dict = {"Tom Hanks": tom, "Kevin Bacon": kevin}
+
+    with QueryCache(cache_path, "v1") as cache:
+        ActorQuery("Tom Hanks", "Kevin Bacon").run_cached(actors_dict, cache,
+                                                          sample_catalog)
+        assert len(cache) == 1
+
+        def fail_bfs(self, actors, film_catalog):
+            raise AssertionError("run_bfs should not be called on a hit")
+        monkeypatch.setattr(ActorQuery, "run_bfs", fail_bfs)
+
+        query = ActorQuery("Tom Hanks", "Kevin Bacon")
+        query.run_cached(actors_dict, cache, sample_catalog)
+
+    assert query.bacon_number == 1
+    assert query.complete_path[0].shared_films == ["Apollo 13"]
+
+
+def test_run_cached_does_not_store_invalid_query(cache_path, sample_catalog,
+                                                 capsys):
+    """Test that queries with unknown actors are not cached."""
+    actors_dict = {"Tom Hanks": Actor(name="Tom Hanks", id="A1", films=[])}
+    with QueryCache(cache_path, "v1") as cache:
+        ActorQuery("Tom Hanks", "Unknown Actor").run_cached(
+            actors_dict, cache, sample_catalog)
+        assert len(cache) == 0
+    assert "Second actor Unknown Actor not found." in capsys.readouterr().out
@@ -1,11 +1,17 @@
 # == Standard Library import
+import hashlib
+import sys
 from pathlib import Path
 # == Third party import
+import numpy as np
 import pandas as pd
 # == Local import
-from models import Actor
+from models import Actor, FilmCatalog
 
 INPUT_MSG = "USER INPUT"
+# bump when the graph built from the same data changes shape, so that
+# results cached against the old graph are invalidated
+GRAPH_FORMAT = "3"
 
 def _get_user_input() -> tuple[str, str]:
     """
@@ -17,70 +23,115 @@ def _get_user_input() -> tuple[str, str]:
     actor_2 = input("Please type the name of the second actor: ")
     return actor_1, actor_2
 
-def _process_actor_row(row: pd.Series, a_dict: dict) -> None:
+def _compute_graph_version(df: pd.DataFrame) -> str:
     """
-    Builds an actor object from fields in row of data.
+    Compute a version string identifying this snapshot of the dataset.
+    Hashes the row contents, so any edit to the data yields a new version
+    while reloading an unchanged file yields the same one.
 
-    :param row: Pandas row information for actors, movies
-    :param a_dict: Dictionary of actors (k: name, v: object)
-    :return: nothing, dictionary updated.
+    :param df: Movie data as loaded from disk.
+    :return: Hex digest identifying the dataset contents.
     """
-    # pull actor name, id, films from row
-    act_name, act_id, films = row['Actor'], row['ActorID'], row['Film']
-    # build actor object from data and set to actor name as key
-    a_dict[act_name] = Actor(act_name, act_id, films)
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    digest = hashlib.sha256(GRAPH_FORMAT.encode())
+    digest.update(",".join(df.columns).encode())
+    digest.update(row_hashes.tobytes())
+    return digest.hexdigest()[:16]
 
-def _build_cast_dict(df: pd.DataFrame) -> dict[str, list[str]]:
+def _group_pairs(keys: np.ndarray, values: np.ndarray, n_keys: int) \
+        -> tuple[np.ndarray, np.ndarray]:
     """
-    Build a mapping from film title to cast list. Groups input df by film
-    and returns a dict where each key is film title and each value is list
-    of actor names in the film.
+    Group (key, value) integer pairs into CSR form. Duplicate pairs are
+    dropped and values are sorted within each key.
 
-    :param df: Movie data with Film and Actor columns.
-    :return: Dict, key (film title) to value (list of actor names).
+    :param keys: Integer key per pair, in range [0, n_keys).
+    :param values: Integer value per pair.
+    :param n_keys: Number of distinct keys.
+    :return: Tuple of (offsets, members) where the values for key k are
+    members[offsets[k]:offsets[k + 1]].
     """
-    return df.groupby('Film')['Actor'].apply(list).to_dict()
+    pairs = np.unique(np.stack([keys, values], axis=1), axis=0)
+    offsets = np.zeros(n_keys + 1, dtype=np.int64)
+    np.cumsum(np.bincount(pairs[:, 0], minlength=n_keys), out=offsets[1:])
+    return offsets, pairs[:, 1].astype(np.int32)
 
-def _build_actor_rows(df: pd.DataFrame) -> pd.DataFrame:
+def _numeric_column(rows: pd.DataFrame, column: str, dtype: type) \
+        -> np.ndarray:
     """
-    Build an actor-level dataframe with aggregated filmographies. Groups
-    input df by actor, actor ID, aggregating titles for each actor into a
-    list. The resulting df has one row per unique actor and a 'Film' column
-    containing that actor's films.
-
-    :param df: Movie data with Actor, ActorID, and Film columns.
-    :return: Dataframe with columns ['Actor', 'ActorID', 'Film'] where
-    'Film' is a list of film titles per actor.
+    Convert a string column to a numeric array. Unparseable values become
+    NaN for floating dtypes and 0 otherwise.
+
+    :param rows: Dataframe holding the column.
+    :param column: Name of the column to convert.
+    :param dtype: Numpy dtype of the resulting array.
+    :return: Numeric array, one entry per row.
+    """
+    values = pd.to_numeric(rows[column], errors='coerce')
+    if not np.issubdtype(dtype, np.floating):
+        values = values.fillna(0)
+    return values.to_numpy(dtype=dtype)
+
+def _build_film_catalog(df: pd.DataFrame, film_codes: np.ndarray,
+                        actor_codes: np.ndarray, actor_names: list[str]) \
+        -> FilmCatalog:
+    """
+    Build the columnar film catalog. Films are keyed by FilmID, so remakes
+    sharing a title keep separate casts. Per-film fields are taken from
+    each film's first row, and titles are interned once.
+
+    :param df: Movie data with FilmID, Film, Year, Rating, Votes columns.
+    :param film_codes: Dense film index per row of df.
+    :param actor_codes: Dense actor index per row of df.
+    :param actor_names: Actor name for each actor index.
+    :return: Populated FilmCatalog.
     """
-    return (df.groupby(['Actor', 'ActorID'])['Film']
-            .apply(list).reset_index())
+    # codes are assigned in order of first appearance, so the first row of
+    # each film is already in film index order
+    film_rows = df[~pd.Series(film_codes).duplicated().to_numpy()]
+    title_codes, titles = pd.factorize(film_rows['Film'])
+    cast_offsets, cast_members = _group_pairs(film_codes, actor_codes,
+                                              len(film_rows))
+    return FilmCatalog(
+        film_ids=film_rows['FilmID'].tolist(),
+        title_codes=title_codes.astype(np.int32),
+        titles=[sys.intern(title) for title in titles],
+        years=_numeric_column(film_rows, 'Year', np.int32),
+        ratings=_numeric_column(film_rows, 'Rating', np.float32),
+        votes=_numeric_column(film_rows, 'Votes', np.int64),
+        cast_offsets=cast_offsets,
+        cast_members=cast_members,
+        actor_names=actor_names,
+    )
 
-def _build_actors(actor_rows: pd.DataFrame, cast_dict: dict[str, list[str]]) \
+def _build_actors(df: pd.DataFrame, film_codes: np.ndarray,
+                  actor_codes: np.ndarray, catalog: FilmCatalog) \
         -> dict[str, Actor]:
     """
     Construct Actor domain objects and populate co-star relationships.
-    Creates one Actor object per row in given actor_rows df and builds each
-    actor's filmography and co-star set using the provided film-to-cast
-    mapping.
+    Each actor's filmography is the list of film indices they appear in,
+    and their co-stars are the union of those films' casts.
 
-    :param actor_rows: Dataframe with columns ['Actor', 'ActorID', 'Film'] where
-    'Film' is a list of film titles per actor.
-    :param cast_dict: Dict, key (film title) to value (list of actor names).
+    :param df: Movie data with Actor and ActorID columns.
+    :param film_codes: Dense film index per row of df.
+    :param actor_codes: Dense actor index per row of df.
+    :param catalog: Film catalog built from the same rows.
     :return: Dictionary mapping actor name to populated Actor objects.
     """
+    names = catalog.actor_names
+    actor_ids = df['ActorID'].to_numpy()[
+        ~pd.Series(actor_codes).duplicated().to_numpy()]
+    film_offsets, film_members = _group_pairs(actor_codes, film_codes,
+                                              len(names))
     # instantiate dict mapping actor name to actor objects.
     actors_dict: dict[str, Actor] = {}
-    # helper func to create actor objects from actor data and store in dict
-    actor_rows.apply(_process_actor_row, axis=1, args=(actors_dict,))
-    # for each actor in the dictionary of actors
-    for actor_obj in actors_dict.values():
-        # for each film title in the current actor's filmography
-        for film_title in actor_obj.films:
-            # add the cast list to a set in the actor object (remove duplicates)
-            actor_obj.costars.update(cast_dict[film_title])
-        # remove the actor from their own costar list
-        actor_obj.costars.remove(actor_obj.name)
-    # return tuple containing dictionaries of actors, casts
+    for actor, (name, act_id) in enumerate(zip(names, actor_ids)):
+        films = film_members[film_offsets[actor]:film_offsets[actor + 1]]
+        # union of all casts the actor appears in, minus the actor
+        costars = np.unique(np.concatenate(
+            [catalog.cast(film) for film in films]))
+        actors_dict[name] = Actor(
+            name, act_id, films.tolist(),
+            costars={names[a] for a in costars if a != actor})
     return actors_dict
 
 
@@ -97,11 +148,17 @@ class Loader:
               - actor_2 (str): The user-provided destination actor.
               - actor_dict (Dict[str, Actor]): Dictionary mapping actor
               names to Actor objects.
+              - film_catalog (FilmCatalog): Columnar catalog of films,
+              indexed by the film ids stored in Actor.films.
+              - graph_version (str): Hash identifying the loaded dataset,
+              used to invalidate cached query results.
           """
         self.filepath: Path = Path(fpath)
         self.actor_1: str
         self.actor_2: str
         self.actor_1, self.actor_2 = _get_user_input()
+        self.graph_version: str = ""
+        self.film_catalog: FilmCatalog
         self.actor_dict: dict[str, Actor] = self._load_data()
 
     def _load_dataframe(self) -> pd.DataFrame:
@@ -114,13 +171,18 @@ class Loader:
     def _load_data(self) -> dict[str, Actor]:
         """
         Load movie data and construct the Actor graph. Reads the raw dataset
-        from disk, derives actor-level filmographies and film-to-cast
-        mappings, and builds populated Actor objects with co-star
-        relationships.
+        from disk, builds the FilmID-keyed film catalog, and builds
+        populated Actor objects with co-star relationships. Also records the
+        dataset's graph_version and film_catalog.
 
         :return: Dictionary mapping actor name to Actor objects.
         """
         df = self._load_dataframe()
-        actor_rows = _build_actor_rows(df)
-        cast_dict = _build_cast_dict(df)
-        return _build_actors(actor_rows, cast_dict)
\ No newline at end of file
+        self.graph_version = _compute_graph_version(df)
+        df = df.dropna(subset=['Actor', 'Film', 'FilmID'])
+        # dense integer ids for films (by FilmID) and actors (by name)
+        film_codes, _ = pd.factorize(df['FilmID'])
+        actor_codes, actor_names = pd.factorize(df['Actor'])
+        self.film_catalog = _build_film_catalog(
+            df, film_codes, actor_codes, actor_names.tolist())
+        return _build_actors(df, film_codes, actor_codes, self.film_catalog)
\ No newline at end of file